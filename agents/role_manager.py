@@ -2,21 +2,54 @@
 AI Role Manager
 Responsible for loading, managing and coordinating different AI roles
 """
-import json
-from typing import Dict, Optional
+import logging
+import pickle
+import string
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Deque, Dict, NamedTuple, Optional
 from pathlib import Path
-from dataclasses import dataclass
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
-@dataclass
-class RoleConfig:
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Template files above this size are parsed incrementally with ijson (when
+# installed) instead of being materialized in one batch
+_STREAM_THRESHOLD = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+class RoleConfig(NamedTuple):
+    """Immutable role template record
+
+    A NamedTuple rather than a dataclass: construction from an iterable via
+    _make is a single C-level tuple build instead of seven per-field
+    assignments, which matters when loading many templates.
+    """
     name: str
     description: str
     api_type: str
     prompt_template: str
     concurrent: bool
-    temperature: Optional[float]
-    max_tokens: Optional[int]
+    temperature: Optional[float] = None
+    max_tokens: Optional[int] = None
+    # Placeholder names pre-parsed from prompt_template at load time so
+    # rendering never has to re-scan the template for {fields}
+    template_fields: frozenset = frozenset()
+
+    def render(self, **context) -> str:
+        """Render prompt_template using only the placeholders it declares"""
+        return self.prompt_template.format_map(
+            {key: context[key] for key in self.template_fields})
 
 
 class Agent:
@@ -26,8 +59,102 @@ class Agent:
         self.role_config = role_config
         pass
 
+    def reset(self):
+        """Clear per-call state so the agent can be reused from a pool"""
+        pass
+
     def terminate(self):
+        self.reset()
+
+
+class AgentPool:
+    """Bounded free list of Agent instances for a single role
+
+    Reusing agents amortizes allocation and GC pressure in batch/concurrent
+    workflows where agents are created and terminated per request.
+    """
+
+    def __init__(self, factory: Callable[[], Agent], max_size: int = 64):
+        self._factory = factory
+        self._free: Deque[Agent] = deque()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+
+    def acquire(self) -> Agent:
+        """Take an agent from the pool, building a new one if none are free"""
+        with self._lock:
+            if self._free:
+                return self._free.popleft()
+        return self._factory()
+
+    def release(self, agent: Agent):
+        """Return an agent to the pool after resetting its state"""
+        agent.reset()
+        with self._lock:
+            if len(self._free) < self._max_size:
+                self._free.append(agent)
+
+
+def _template_fields(template: str) -> frozenset:
+    """Extract the placeholder names of a str.format template"""
+    return frozenset(
+        name for _, name, _, _ in string.Formatter().parse(template) if name)
+
+
+def _make_role(data: Dict) -> RoleConfig:
+    """Build a RoleConfig record from a parsed template entry"""
+    return RoleConfig._make((
+        data["name"],
+        data["description"],
+        data["api_type"],
+        data["prompt_template"],
+        data["concurrent"],
+        data.get("temperature"),
+        data.get("max_tokens"),
+        _template_fields(data["prompt_template"]),
+    ))
+
+
+def _iter_role_items(json_path: Path):
+    """Yield (name, RoleConfig) pairs incrementally from a template file
+
+    Uses ijson so each role is available as soon as it is parsed, without
+    materializing the whole document first.
+    """
+    with open(json_path, "rb") as f:
+        for name, data in ijson.kvitems(f, ""):
+            yield name, _make_role(data)
+
+
+@lru_cache(maxsize=None)
+def _load_templates(path: str, mtime_ns: int) -> Dict[str, RoleConfig]:
+    """Load role templates, using a pickle sidecar as a fast path
+
+    The parsed templates are compiled into ``<path>.cache.pkl`` keyed by the
+    JSON file's mtime; subsequent boots unpickle the ready-made RoleConfig
+    dict instead of re-parsing JSON. The lru_cache shares the result across
+    RoleManager instances in the same process.
+    """
+    json_path = Path(path)
+    cache_path = json_path.with_suffix(".cache.pkl")
+    try:
+        if cache_path.stat().st_mtime_ns >= mtime_ns:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError):
+        pass
+
+    if ijson is not None and json_path.stat().st_size > _STREAM_THRESHOLD:
+        roles = dict(_iter_role_items(json_path))
+    else:
+        raw = _json.loads(json_path.read_bytes())
+        roles = {name: _make_role(data) for name, data in raw.items()}
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(roles, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
         pass
+    return roles
 
 
 class RoleManager:
@@ -37,32 +164,53 @@ class RoleManager:
         self.template_path = Path(template_path)
         self.roles: Dict[str, RoleConfig] = {}
         self.active_roles: Dict[str, Agent] = {}
+        self._pools: Dict[str, AgentPool] = {}
 
     def load_templates(self) -> bool:
         """Load role templates"""
         try:
-            with open(self.template_path, 'r', encoding='utf-8') as f:
-                self.roles = json.load(f)
+            mtime_ns = self.template_path.stat().st_mtime_ns
+            self.roles = _load_templates(str(self.template_path), mtime_ns)
+            # Pooled agents hold the configs they were built with; a
+            # reload must not keep serving agents bound to stale configs
+            self._pools.clear()
             return True
         except Exception as e:
-            print(f"Failed to load role templates: {str(e)}")
+            logger.exception("Failed to load role templates: %s", e)
             return False
 
+    def iter_roles(self):
+        """Iterate (name, RoleConfig) pairs, streaming from disk when possible
+
+        Falls back to the loaded dict when templates are already in memory
+        or ijson is unavailable.
+        """
+        if self.roles or ijson is None:
+            if not self.roles:
+                self.load_templates()
+            yield from self.roles.items()
+        else:
+            yield from _iter_role_items(self.template_path)
+
     def get_role(self, role_name: str) -> Optional[RoleConfig]:
         """Get configuration for specified role"""
         return self.roles.get(role_name)
 
     def create_agent(self, role_name: str) -> Optional[Agent]:
-        """Create new AI agent instance"""
+        """Create new AI agent instance, reusing pooled agents when available"""
         if role_config := self.get_role(role_name):
-            role = Agent(role_config)
-            return role
+            pool = self._pools.setdefault(
+                role_config.name, AgentPool(lambda: Agent(role_config)))
+            return pool.acquire()
         return None
 
     def terminate_agent(self, agent_id: str) -> bool:
-        """Terminate specified AI agent"""
-        if agent := self.active_roles.get(agent_id):
-            agent.terminate()
+        """Terminate specified AI agent and return it to its role pool"""
+        if agent := self.active_roles.pop(agent_id, None):
+            if pool := self._pools.get(agent.role_config.name):
+                pool.release(agent)
+            else:
+                agent.terminate()
             return True
         return False
 
@@ -5,13 +5,66 @@ This package handles all API integrations and their configurations.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from enum import Enum
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_if_needed() -> None:
+    """Load .env once, and only when the environment is not already populated
+
+    Production containers get their variables from the orchestrator; in that
+    case opening and parsing .env is wasted disk I/O on every process start.
+    """
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    if os.getenv("OPENROUTER_API_KEY") is None:
+        load_dotenv()
+    _DOTENV_LOADED = True
+
+
+# Attribute name -> (environment variable, parser, default). Parsing happens
+# lazily on first attribute access and the result is cached on the class, so
+# importing this package touches no environment variables at all.
+_ENV_SPEC: Dict[str, Any] = {
+    "BASE_URL": ("OPENROUTER_API_BASE_URL", str, "https://openrouter.ai/api/v1"),
+    "API_KEY": ("OPENROUTER_API_KEY", str, None),
+    "DEFAULT_TIMEOUT": ("OPENROUTER_API_TIMEOUT", int, 30),
+    "DEFAULT_MODEL": ("OPENROUTER_DEFAULT_MODEL", str, "openai/gpt-4"),
+    "DEFAULT_TEMPERATURE": ("OPENROUTER_DEFAULT_TEMPERATURE", float, 0.7),
+    "DEFAULT_MAX_TOKENS": ("OPENROUTER_DEFAULT_MAX_TOKENS", int, 2000),
+    "SITE_URL": ("OPENROUTER_SITE_URL", str, None),
+    "SITE_NAME": ("OPENROUTER_SITE_NAME", str, None),
+    "MAX_RETRIES": ("OPENROUTER_MAX_RETRIES", int, 3),
+    "RETRY_DELAY": ("OPENROUTER_RETRY_DELAY", float, 1.0),
+}
+
+
+class _EnvConfigMeta(type):
+    """Metaclass resolving _ENV_SPEC attributes from the environment on first access"""
+
+    def __getattr__(cls, name: str) -> Any:
+        try:
+            env_var, parse, default = _ENV_SPEC[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        _load_dotenv_if_needed()
+        raw = os.environ.get(env_var)
+        value = default if raw is None else parse(raw)
+        setattr(cls, name, value)
+        return value
+
+
+def clear_env_cache() -> None:
+    """Forget cached environment values so they are re-read on next access"""
+    for name in _ENV_SPEC:
+        if name in OpenRouterConfig.__dict__:
+            delattr(OpenRouterConfig, name)
 
 class OpenRouterError(Exception):
     """Base exception class for OpenRouter API errors"""
@@ -55,7 +108,7 @@ class HTTPStatus(Enum):
     BAD_GATEWAY = 502
     SERVICE_UNAVAILABLE = 503
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OpenRouterResponse:
     """Standardized response structure"""
     content: Optional[str] = None
@@ -64,27 +117,47 @@ class OpenRouterResponse:
     model: Optional[str] = None
     finish_reason: Optional[str] = None
 
-class OpenRouterConfig:
-    """OpenRouter API configuration and constants"""
-    
+@lru_cache(maxsize=256)
+def _validate_temperature(temp: float, lo: float, hi: float) -> float:
+    """Clamp temperature into [lo, hi], memoizing repeated inputs"""
+    return max(min(temp, hi), lo)
+
+
+@lru_cache(maxsize=256)
+def _validate_max_tokens(tokens: int, lo: int, hi: int) -> int:
+    """Validate max_tokens bounds, memoizing repeated inputs"""
+    if not lo <= tokens <= hi:
+        raise ConfigurationError(
+            f"max_tokens must be between {lo} and {hi}")
+    return tokens
+
+
+class OpenRouterConfig(metaclass=_EnvConfigMeta):
+    """OpenRouter API configuration and constants
+
+    Environment-derived attributes (see _ENV_SPEC) are resolved lazily by
+    the metaclass on first access and cached on the class.
+    """
+
     # Base configuration
-    BASE_URL: str = os.getenv("OPENROUTER_API_BASE_URL", "https://openrouter.ai/api/v1")
-    API_KEY: Optional[str] = os.getenv("OPENROUTER_API_KEY")
-    DEFAULT_TIMEOUT: int = int(os.getenv("OPENROUTER_API_TIMEOUT", "30"))
-    
+    BASE_URL: str
+    API_KEY: Optional[str]
+    DEFAULT_TIMEOUT: int
+
     # Default model settings
-    DEFAULT_MODEL: str = os.getenv("OPENROUTER_DEFAULT_MODEL", "openai/gpt-4")
-    DEFAULT_TEMPERATURE: float = float(os.getenv("OPENROUTER_DEFAULT_TEMPERATURE", "0.7"))
-    DEFAULT_MAX_TOKENS: int = int(os.getenv("OPENROUTER_DEFAULT_MAX_TOKENS", "2000"))
-    
+    DEFAULT_MODEL: str
+    DEFAULT_TEMPERATURE: float
+    DEFAULT_MAX_TOKENS: int
+
     # Optional site information for rankings
-    SITE_URL: Optional[str] = os.getenv("OPENROUTER_SITE_URL")
-    SITE_NAME: Optional[str] = os.getenv("OPENROUTER_SITE_NAME")
+    SITE_URL: Optional[str]
+    SITE_NAME: Optional[str]
 
     # Rate limiting settings
-    MAX_RETRIES: int = int(os.getenv("OPENROUTER_MAX_RETRIES", "3"))
-    RETRY_DELAY: float = float(os.getenv("OPENROUTER_RETRY_DELAY", "1.0"))
-    
+    MAX_RETRIES: int
+    RETRY_DELAY: float
+
+
     # Validation settings
     MIN_TEMPERATURE: float = 0.0
     MAX_TEMPERATURE: float = 2.0
@@ -94,15 +167,12 @@ class OpenRouterConfig:
     @classmethod
     def validate_temperature(cls, temp: float) -> float:
         """Validate and clamp temperature value"""
-        return max(min(temp, cls.MAX_TEMPERATURE), cls.MIN_TEMPERATURE)
+        return _validate_temperature(temp, cls.MIN_TEMPERATURE, cls.MAX_TEMPERATURE)
 
     @classmethod
     def validate_max_tokens(cls, tokens: int) -> int:
         """Validate max_tokens value"""
-        if not cls.MIN_MAX_TOKENS <= tokens <= cls.MAX_MAX_TOKENS:
-            raise ConfigurationError(
-                f"max_tokens must be between {cls.MIN_MAX_TOKENS} and {cls.MAX_MAX_TOKENS}")
-        return tokens
+        return _validate_max_tokens(tokens, cls.MIN_MAX_TOKENS, cls.MAX_MAX_TOKENS)
 
     @classmethod
     def validate_api_key(cls, api_key: Optional[str]) -> str:
@@ -0,0 +1,40 @@
+"""
+JSON Serialization Helpers
+
+Single place that selects the fastest available JSON codec for the API
+clients' request/response hot paths. msgspec's C-level encoder is
+preferred, then orjson (Rust, SIMD-accelerated), with the stdlib json
+module as the transparent fallback.
+
+Both `dumps` variants return bytes ready to be sent as an HTTP body, and
+`loads` accepts the raw bytes of a response body directly, skipping the
+intermediate str decode that text-mode parsing would pay.
+"""
+
+try:
+    from msgspec import DecodeError
+    from msgspec import json as _msgspec_json
+
+    dumps = _msgspec_json.encode
+    loads = _msgspec_json.decode
+
+except ImportError:
+    try:
+        import orjson
+
+        def dumps(obj) -> bytes:
+            """Serialize obj to UTF-8 JSON bytes"""
+            return orjson.dumps(obj)
+
+        loads = orjson.loads
+        DecodeError = orjson.JSONDecodeError
+
+    except ImportError:
+        import json
+
+        def dumps(obj) -> bytes:
+            """Serialize obj to UTF-8 JSON bytes"""
+            return json.dumps(obj).encode("utf-8")
+
+        loads = json.loads
+        DecodeError = json.JSONDecodeError
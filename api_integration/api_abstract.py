@@ -5,14 +5,19 @@ This module defines the core interfaces and data structures for API integrations
 It provides abstract base classes that all specific API implementations must follow,
 ensuring consistent behavior across different API providers.
 """
+from __future__ import annotations
+
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Dict, Any, Optional
 
 from agents.role_manager import Agent
 
+__all__ = ["APIBase", "ApiConfig", "BaseAIProvider"]
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApiConfig:
     """
     Configuration data class for API settings
@@ -28,6 +33,27 @@ class ApiConfig:
     model: Optional[str] = None
     timeout: Optional[int] = None
 
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, Any]) -> "ApiConfig":
+        """
+        Build a config record from a parsed mapping
+
+        Unknown keys are ignored so raw config entries with extra fields
+        still materialize, and string base_urls are interned since the
+        same endpoints recur across entries and reloads.
+
+        Args:
+            mapping (Dict[str, Any]): Parsed configuration entry
+
+        Returns:
+            ApiConfig: Typed configuration record
+        """
+        known = {f.name for f in fields(cls)}
+        values = {k: v for k, v in mapping.items() if k in known}
+        if isinstance(values.get("base_url"), str):
+            values["base_url"] = sys.intern(values["base_url"])
+        return cls(**values)
+
 
 class APIBase(ABC):
     """
@@ -5,7 +5,9 @@ This module provides a centralized manager for handling different API integratio
 It maintains a registry of API instances and manages their configurations.
 """
 
-from typing import Dict, Optional
+import asyncio
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from api_integration.api_abstract import APIBase, ApiConfig
 from api_integration.openrouter_api import OpenRouterAPI, OpenRouterConfig
@@ -15,36 +17,69 @@ from utils.config_loader import ConfigLoader
 class ApiManager:
     """
     A singleton manager class that handles registration and access to different API integrations.
-    
+
     Attributes:
-        apis (Dict[str, APIBase]): Dictionary storing API instances with their names as keys
+        apis (Dict[str, Union[APIBase, Callable[[], APIBase]]]): Dictionary storing
+            API instances, or factory callables that build them on first access
     """
-    apis: Dict[str, APIBase] = {}
+    apis: Dict[str, Union[APIBase, Callable[[], APIBase]]]
 
     def __init__(self):
         """Initialize an empty API manager"""
-        pass
+        self.apis = {}
 
     def add_api(self, api: APIBase):
         """
         Register a new API instance in the manager
-        
+
         Args:
             api (APIBase): The API instance to register
         """
-        self.apis[api.api_name] = api
+        self.apis[sys.intern(api.api_name)] = api
+
+    def add_api_factory(self, api_name: str, factory: Callable[[], APIBase]):
+        """
+        Register a lazy API factory in the manager
+
+        The factory is only invoked (reading env, building headers, etc.) the
+        first time the API is requested via get_api.
+
+        Args:
+            api_name (str): The name the API will be registered under
+            factory (Callable[[], APIBase]): Zero-argument callable building the API
+        """
+        self.apis[sys.intern(api_name)] = factory
+
+    def is_instantiated(self, key: str) -> bool:
+        """
+        Check whether an API has been materialized (not just registered lazily)
+
+        Args:
+            key (str): The name of the API to check
+
+        Returns:
+            bool: True if the API instance exists, False if unregistered or pending
+        """
+        return isinstance(self.apis.get(key), APIBase)
 
     def get_api(self, key: str) -> Optional[APIBase]:
         """
         Retrieve an API instance by its name
-        
+
+        Lazily registered APIs are instantiated on first access and the
+        resulting instance replaces the factory for subsequent calls.
+
         Args:
             key (str): The name of the API to retrieve
-            
+
         Returns:
             Optional[APIBase]: The requested API instance if found, None otherwise
         """
-        return self.apis[key]
+        api = self.apis.get(sys.intern(key))
+        if api is not None and not isinstance(api, APIBase):
+            api = api()
+            self.apis[key] = api
+        return api
 
     def get_config(self, config: ConfigLoader, name: str) -> ApiConfig:
         """
@@ -58,8 +93,9 @@ class ApiManager:
             ApiConfig: Configuration for the specified API, or empty config if not found
         """
         if name == "openrouter":
-            # Special handling for OpenRouter config
-            raw_config = config.get_config(name) or {}
+            # Special handling for OpenRouter config, which carries extra
+            # fields beyond the common ApiConfig record
+            raw_config = config.get_raw_config(name) or {}
             return OpenRouterConfig(
                 base_url=raw_config.get("base_url"),
                 api_key=raw_config.get("api_key"),
@@ -80,5 +116,45 @@ class ApiManager:
         Returns:
             bool: True if initialization was successful
         """
-        self.add_api(OpenRouterAPI(self.get_config(config, "openrouter")))
+        self.add_api_factory(
+            "openrouter",
+            lambda: OpenRouterAPI(self.get_config(config, "openrouter")))
         return True
+
+    async def call_batch(self, api_name: str,
+                         requests: Iterable[Dict[str, Any]],
+                         concurrency: int = 16) -> List[Any]:
+        """
+        Dispatch multiple API calls concurrently through one API instance
+
+        Requests run through a single shared session with a bounded semaphore
+        so their HTTP latency overlaps instead of accumulating serially.
+
+        Args:
+            api_name (str): Name of the registered API to call
+            requests (Iterable[Dict[str, Any]]): Keyword-argument dicts passed
+                to the API's call_api (endpoint, method, data)
+            concurrency (int): Maximum number of in-flight requests
+
+        Returns:
+            List[Any]: Per-request results in input order; failed requests
+                yield their exception instead of raising
+        """
+        api = self.get_api(api_name)
+        if api is None:
+            raise KeyError(f"Unknown API: {api_name}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _call_one(request: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await api.call_api(**request)
+
+        return await asyncio.gather(
+            *(_call_one(request) for request in requests),
+            return_exceptions=True)
+
+    async def shutdown(self):
+        """Release resources held by instantiated APIs (e.g. HTTP sessions)"""
+        for api in self.apis.values():
+            if isinstance(api, APIBase) and hasattr(api, "close"):
+                await api.close()
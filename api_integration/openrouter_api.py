@@ -7,11 +7,31 @@ including chat completions, tool calls, structured outputs, and more.
 
 import json
 import asyncio
+import hashlib
+import importlib.util
+import os
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 from enum import Enum
 import aiohttp
+from multidict import CIMultiDict
+from yarl import URL
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from . import _json
 from .api_abstract import APIBase, ApiConfig, BaseAIProvider
 from agents.role_manager import Agent
 from . import (
@@ -26,6 +46,35 @@ from . import (
     HTTPStatus
 )
 
+# Persistent background event loop shared by all synchronous query()
+# callers. Running it on a daemon thread keeps the shared client session
+# (which is bound to this loop) alive across calls, instead of paying
+# asyncio.run's loop construction and teardown per query.
+_QUERY_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_QUERY_LOOP_LOCK = threading.Lock()
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    """Retrieve a future's exception so coalesced failures do not warn"""
+    if not future.cancelled():
+        future.exception()
+
+
+def _get_query_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting its thread on first use"""
+    global _QUERY_LOOP
+    if _QUERY_LOOP is None or _QUERY_LOOP.is_closed():
+        with _QUERY_LOOP_LOCK:
+            if _QUERY_LOOP is None or _QUERY_LOOP.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="openrouter-query-loop",
+                    daemon=True).start()
+                _QUERY_LOOP = loop
+    return _QUERY_LOOP
+
+
 class OpenRouterModel(str, Enum):
     """Commonly used OpenRouter models"""
     GPT4 = "openai/gpt-4"
@@ -35,7 +84,7 @@ class OpenRouterModel(str, Enum):
     MIXTRAL = "mistralai/mixtral-8x7b-instruct"
     DEEPSEEK_CHAT = "deepseek/deepseek-chat"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OpenRouterConfig(ApiConfig):
     """Extended configuration for OpenRouter API"""
     http_referer: Optional[str] = None  # Site URL for rankings
@@ -44,6 +93,12 @@ class OpenRouterConfig(ApiConfig):
 class OpenRouterAPI(APIBase, BaseAIProvider):
     """OpenRouter API Implementation Class"""
 
+    # Maximum number of deterministic query results kept in the LRU cache
+    QUERY_CACHE_SIZE = 1024
+
+    # Response bodies above this size are worth incremental stream parsing
+    _STREAM_PARSE_THRESHOLD = 8 * 1024
+
     def __init__(self, config: OpenRouterConfig, api_name: str = "openrouter"):
         try:
             # Use provided config first, then fall back to environment variables
@@ -56,15 +111,103 @@ class OpenRouterAPI(APIBase, BaseAIProvider):
             self.http_referer = config.http_referer or Config.SITE_URL
             self.x_title = config.x_title or Config.SITE_NAME
 
+            # Shared HTTP session state, created lazily on first request;
+            # the session is bound to the loop that created it, so the
+            # owning loop is tracked and the session rebuilt if callers
+            # switch loops (e.g. separate asyncio.run calls, sync query)
+            self._session: Optional[aiohttp.ClientSession] = None
+            self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+            self._client_timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+            # Optional HTTP/2 transport: multiplexes concurrent requests
+            # over one TLS connection when httpx is installed and enabled.
+            # httpx.AsyncClient(http2=True) needs the h2 extra, so probe
+            # for it too — a plain httpx install falls back to aiohttp
+            self._httpx_client = None
+            self._use_http2 = (
+                httpx is not None
+                and importlib.util.find_spec("h2") is not None
+                and os.getenv("OPENROUTER_HTTP2") == "1")
+
+            # Endpoint -> parsed URL cache; aiohttp accepts yarl.URL
+            # directly and skips re-parsing the URL string per request
+            self._url_cache: Dict[str, URL] = {}
+
+            # LRU cache of deterministic (temperature ~ 0) query results
+            self._query_cache: OrderedDict = OrderedDict()
+
+            # TTL cache for idempotent GETs: key -> (expires_at, value),
+            # with per-key locks to stampede-protect concurrent misses
+            self._get_cache: Dict[str, Any] = {}
+            self._get_cache_locks: Dict[str, asyncio.Lock] = {}
+
+            # In-flight request futures keyed by (loop, endpoint, method,
+            # body digest): a future can only be awaited on its own loop,
+            # so duplicates are coalesced per event loop and cross-loop
+            # duplicates issue their own request
+            self._inflight: Dict[tuple, asyncio.Future] = {}
+
+            # Defaults resolved once so the per-request payload build does
+            # plain instance-attribute loads instead of config lookups
+            self._default_temperature = Config.DEFAULT_TEMPERATURE
+            self._default_max_tokens = Config.DEFAULT_MAX_TOKENS
+            self._base_data = self._make_data_builder()
+
             super().__init__(api_name, config)
-        except Exception as e:
+
+            # Freeze the headers built once by APIBase: a read-only mapping
+            # guards against accidental per-request mutation, and the
+            # prebuilt CIMultiDict is the structure aiohttp wants, skipping
+            # its dict->CIMultiDict conversion at session construction.
+            self.headers = MappingProxyType(dict(self.headers))
+            self._headers_multidict = CIMultiDict(self.headers)
+        except OpenRouterError:
+            raise
+        except (KeyError, ValueError, AttributeError, TypeError) as e:
             raise ConfigurationError(f"Failed to initialize OpenRouter API: {str(e)}")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared client session, creating it on first use
+
+        Reusing one session keeps the connection pool (and its keep-alive
+        TCP/TLS connections and DNS cache) alive across API calls instead of
+        paying connection setup per request.
+        """
+        loop = asyncio.get_running_loop()
+        if (self._session is None or self._session.closed
+                or self._session_loop is not loop):
+            if self._session is not None and not self._session.closed:
+                # Session belongs to another (possibly closed) loop;
+                # best-effort close before rebuilding on this one
+                try:
+                    await self._session.close()
+                except Exception:
+                    pass
+            self._session = aiohttp.ClientSession(
+                headers=self._headers_multidict,
+                timeout=self._client_timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=100, ttl_dns_cache=300, keepalive_timeout=60))
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared client session and its connection pool"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._httpx_client is not None and not self._httpx_client.is_closed:
+            await self._httpx_client.aclose()
+        self._httpx_client = None
+
     def _build_headers(self) -> Dict[str, str]:
         """Build API request headers"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            # Completion bodies are highly compressible text; aiohttp
+            # decompresses these transparently (brotli when available)
+            "Accept-Encoding": "gzip, deflate, br"
         }
         
         # Add optional ranking headers
@@ -75,51 +218,145 @@ class OpenRouterAPI(APIBase, BaseAIProvider):
             
         return headers
 
+    def _raise_for_status(self, status: int, error_data: Dict[str, Any]) -> None:
+        """Map an error status code and payload to the matching exception"""
+        if status == HTTPStatus.UNAUTHORIZED.value:
+            raise AuthenticationError("Invalid API key", status, error_data)
+        elif status == HTTPStatus.PAYMENT_REQUIRED.value:
+            raise APIError("Insufficient credits", status, error_data)
+        elif status == HTTPStatus.TOO_MANY_REQUESTS.value:
+            raise APIError("Rate limit exceeded", status, error_data)
+        else:
+            error_msg = error_data.get("error", {}).get("message", str(error_data))
+            raise APIError(f"API request failed: {error_msg}", status, error_data)
+
     async def _handle_error_response(self, response: aiohttp.ClientResponse) -> None:
         """Handle error responses from the API"""
         try:
-            error_data = await response.json()
+            error_data = _json.loads(await response.read())
         except:
             error_data = {"error": "Unknown error"}
 
-        error_msg = error_data.get("error", {}).get("message", str(error_data))
-        
-        if response.status == HTTPStatus.UNAUTHORIZED.value:
-            raise AuthenticationError("Invalid API key", response.status, error_data)
-        elif response.status == HTTPStatus.PAYMENT_REQUIRED.value:
-            raise APIError("Insufficient credits", response.status, error_data)
-        elif response.status == HTTPStatus.TOO_MANY_REQUESTS.value:
-            raise APIError("Rate limit exceeded", response.status, error_data)
-        else:
-            raise APIError(f"API request failed: {error_msg}", response.status, error_data)
+        self._raise_for_status(response.status, error_data)
+
+    def _get_httpx_client(self):
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64, max_keepalive_connections=32),
+                timeout=self.timeout,
+                headers=dict(self.headers))
+        return self._httpx_client
+
+    async def _call_api_http2(self, endpoint: str, method: str,
+                              data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """call_api over the multiplexed HTTP/2 transport"""
+        url = f"{self.base_url}{endpoint}"
+        body = _json.dumps(data) if data is not None else None
+        retries = Config.MAX_RETRIES
+
+        while retries > 0:
+            try:
+                client = self._get_httpx_client()
+                response = await client.request(method, url, content=body)
+                if response.status_code == HTTPStatus.OK.value:
+                    return _json.loads(response.content)
+
+                if response.status_code == HTTPStatus.TOO_MANY_REQUESTS.value:
+                    retries -= 1
+                    if retries > 0:
+                        await asyncio.sleep(Config.RETRY_DELAY)
+                        continue
+
+                try:
+                    error_data = _json.loads(response.content)
+                except Exception:
+                    error_data = {"error": "Unknown error"}
+                self._raise_for_status(response.status_code, error_data)
+
+            except httpx.TimeoutException:
+                raise NetworkError("Request timed out")
+            except httpx.HTTPError as e:
+                raise NetworkError(f"Network request failed: {str(e)}")
+
+        raise APIError("Max retries exceeded")
+
+    def _endpoint_url(self, endpoint: str) -> URL:
+        """Get the parsed URL for an endpoint, cached per instance"""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = URL(f"{self.base_url}{endpoint}")
+        return url
 
     async def call_api(self, endpoint: str, method: str = 'POST',
                       data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Call OpenRouter API with retry logic"""
-        url = f"{self.base_url}{endpoint}"
+        """Call OpenRouter API with retry logic
+
+        Concurrent calls with an identical request body are coalesced
+        (singleflight): the first caller issues the upstream request and
+        the duplicates await its future, so fan-out/fan-in workflows that
+        fire the same prompt from several branches pay one round-trip.
+        """
+        if self._use_http2:
+            return await self._call_api_http2(endpoint, method, data)
+
+        url = self._endpoint_url(endpoint)
+        body = _json.dumps(data) if data is not None else None
+
+        key = None
+        if body is not None:
+            loop = asyncio.get_running_loop()
+            key = (loop, endpoint, method,
+                   hashlib.blake2b(body, digest_size=16).digest())
+            pending = self._inflight.get(key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+            future = loop.create_future()
+            future.add_done_callback(_consume_exception)
+            self._inflight[key] = future
+
+        try:
+            result = await self._request_with_retries(method, url, body)
+        except BaseException as e:
+            if key is not None:
+                self._inflight.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        if key is not None:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(result)
+        return result
+
+    async def _request_with_retries(self, method: str, url: URL,
+                                    body: Optional[bytes]) -> Dict[str, Any]:
+        """Issue one logical request, retrying on rate limits"""
         retries = Config.MAX_RETRIES
-        
+
         while retries > 0:
             try:
-                async with aiohttp.ClientSession(headers=self.headers) as session:
-                    async with session.request(method, url, json=data, timeout=self.timeout) as response:
-                        if response.status == HTTPStatus.OK.value:
-                            return await response.json()
-                        
-                        # Handle rate limiting with retry
-                        if response.status == HTTPStatus.TOO_MANY_REQUESTS.value:
-                            retries -= 1
-                            if retries > 0:
-                                await asyncio.sleep(Config.RETRY_DELAY)
-                                continue
-                        
-                        await self._handle_error_response(response)
-                        
+                session = await self._get_session()
+                async with session.request(method, url, data=body) as response:
+                    if response.status == HTTPStatus.OK.value:
+                        return _json.loads(await response.read())
+
+                    # Handle rate limiting with retry
+                    if response.status == HTTPStatus.TOO_MANY_REQUESTS.value:
+                        retries -= 1
+                        if retries > 0:
+                            await asyncio.sleep(Config.RETRY_DELAY)
+                            continue
+
+                    await self._handle_error_response(response)
+
             except aiohttp.ClientError as e:
                 raise NetworkError(f"Network request failed: {str(e)}")
             except asyncio.TimeoutError:
                 raise NetworkError("Request timed out")
-        
+
         raise APIError("Max retries exceeded")
 
     async def chat_completion(self,
@@ -148,82 +385,241 @@ class OpenRouterAPI(APIBase, BaseAIProvider):
             provider: Provider routing preferences
             **kwargs: Additional parameters
         """
-        try:
-            # Validate input parameters
-            if not messages:
-                raise ConfigurationError("Messages cannot be empty")
+        data = self._build_completion_data(
+            messages, temperature, max_tokens, tools, tool_choice,
+            response_format, transforms, models, provider, **kwargs)
+        return await self.call_api("/chat/completions", "POST", data)
+
+    def _make_data_builder(self):
+        """Build a payload constructor specialized for this instance
 
-            data = {
-                "model": self.model,
-                "messages": messages
+        The model name, defaults and validators are captured as closure
+        locals, so the per-call base payload build runs on fast local
+        loads instead of repeated attribute and config lookups.
+        """
+        model = self.model
+        default_temperature = self._default_temperature
+        default_max_tokens = self._default_max_tokens
+        validate_temperature = Config.validate_temperature
+        validate_max_tokens = Config.validate_max_tokens
+
+        def build(messages, temperature, max_tokens):
+            return {
+                "model": model,
+                "messages": messages,
+                "temperature": (validate_temperature(temperature)
+                                if temperature is not None
+                                else default_temperature),
+                "max_tokens": (validate_max_tokens(max_tokens)
+                               if max_tokens is not None
+                               else default_max_tokens),
             }
 
-            # Add optional parameters with validation
-            if temperature is not None:
-                data["temperature"] = Config.validate_temperature(temperature)
-            else:
-                data["temperature"] = Config.DEFAULT_TEMPERATURE
-
-            if max_tokens is not None:
-                data["max_tokens"] = Config.validate_max_tokens(max_tokens)
-            else:
-                data["max_tokens"] = Config.DEFAULT_MAX_TOKENS
-
-            # Add optional features
-            if tools:
-                data["tools"] = tools
-            if tool_choice:
-                data["tool_choice"] = tool_choice
-            if response_format:
-                data["response_format"] = response_format
-            if transforms:
-                data["transforms"] = transforms
-            if models:
-                data["models"] = models
-            if provider:
-                data["provider"] = provider
-
-            # Add any remaining kwargs
-            data.update({k: v for k, v in kwargs.items() if v is not None})
-
-            response = await self.call_api("/chat/completions", "POST", data)
-            return response
+        return build
 
-        except OpenRouterError:
-            raise
-        except Exception as e:
-            raise APIError(f"Chat completion failed: {str(e)}")
+    def _build_completion_data(self,
+                               messages: List[Dict[str, str]],
+                               temperature: Optional[float] = None,
+                               max_tokens: Optional[int] = None,
+                               tools: Optional[List[Dict[str, Any]]] = None,
+                               tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+                               response_format: Optional[Dict[str, str]] = None,
+                               transforms: Optional[List[str]] = None,
+                               models: Optional[List[str]] = None,
+                               provider: Optional[Dict[str, Any]] = None,
+                               **kwargs) -> Dict[str, Any]:
+        """Build and validate the request payload for a chat completion"""
+        if not messages:
+            raise ConfigurationError("Messages cannot be empty")
+
+        data = self._base_data(messages, temperature, max_tokens)
+
+        # Add optional features: a declarative (key, value) schema filtered
+        # in one pass instead of a branch per field
+        optional = (
+            ("tools", tools),
+            ("tool_choice", tool_choice),
+            ("response_format", response_format),
+            ("transforms", transforms),
+            ("models", models),
+            ("provider", provider),
+        )
+        data.update({key: value for key, value in optional if value})
+
+        # Add any remaining kwargs
+        data.update({k: v for k, v in kwargs.items() if v is not None})
+        return data
+
+    async def _extract_content_streaming(self, response: aiohttp.ClientResponse) -> str:
+        """Pluck choices[0].message.content from the body incrementally
+
+        ijson walks the byte stream and yields the content field without
+        materializing the full parse tree, cutting peak memory for large
+        completions.
+        """
+        async for content in ijson.items(
+                response.content, "choices.item.message.content"):
+            return content
+        raise ResponseError("Response contained no message content")
+
+    async def iter_stream_deltas(self,
+                                 messages: List[Dict[str, str]],
+                                 **params):
+        """Yield content deltas from a streaming chat completion
+
+        Opens the request with stream=True on the shared session and
+        decodes each SSE event with the fast JSON codec as it arrives,
+        yielding the delta text and skipping blank keep-alives and the
+        final [DONE] marker. At tens of events per second per stream this
+        keeps per-event parsing off the stdlib codec.
+        """
+        data = self._build_completion_data(messages, **params)
+        data["stream"] = True
+        url = self._endpoint_url("/chat/completions")
+        try:
+            session = await self._get_session()
+            async with session.post(url, data=_json.dumps(data)) as response:
+                if response.status != HTTPStatus.OK.value:
+                    await self._handle_error_response(response)
+                async for raw_line in response.content:
+                    line = raw_line.strip()
+                    if not line.startswith(b"data: "):
+                        continue
+                    payload = line[6:]
+                    if payload == b"[DONE]":
+                        break
+                    event = _json.loads(payload)
+                    delta = event["choices"][0]["delta"].get("content")
+                    if delta:
+                        yield delta
+        except aiohttp.ClientError as e:
+            raise NetworkError(f"Network request failed: {str(e)}")
+        except asyncio.TimeoutError:
+            raise NetworkError("Request timed out")
+
+    async def chat_completion_content(self,
+                                      messages: List[Dict[str, str]],
+                                      **params) -> str:
+        """Return only the generated text of a chat completion
+
+        When ijson is installed and the response advertises a body larger
+        than _STREAM_PARSE_THRESHOLD, the content field is extracted from
+        the stream instead of buffering and parsing the whole document.
+        Falls back to chat_completion plus format_response otherwise.
+        """
+        if ijson is None:
+            return self.format_response(
+                await self.chat_completion(messages, **params))
+
+        data = self._build_completion_data(messages, **params)
+        url = self._endpoint_url("/chat/completions")
+        try:
+            session = await self._get_session()
+            async with session.post(url, data=_json.dumps(data)) as response:
+                if response.status != HTTPStatus.OK.value:
+                    await self._handle_error_response(response)
+                length = int(response.headers.get("Content-Length", 0))
+                if length > self._STREAM_PARSE_THRESHOLD:
+                    return await self._extract_content_streaming(response)
+                return self.format_response(_json.loads(await response.read()))
+        except aiohttp.ClientError as e:
+            raise NetworkError(f"Network request failed: {str(e)}")
+        except asyncio.TimeoutError:
+            raise NetworkError("Request timed out")
+
+    async def _cached_get(self, key: str, ttl: float, coro_factory) -> Any:
+        """Serve an idempotent request from the TTL cache when fresh
+
+        On a miss the factory coroutine runs under a per-key lock so
+        concurrent callers share one upstream request instead of
+        stampeding the API.
+        """
+        entry = self._get_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        lock = self._get_cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._get_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            value = await coro_factory()
+            self._get_cache[key] = (time.monotonic() + ttl, value)
+            return value
+
+    def invalidate(self, key: str):
+        """Drop one cached GET result (e.g. credits after a purchase)"""
+        self._get_cache.pop(key, None)
 
     async def list_models(self) -> Dict[str, Any]:
-        """Get list of available models"""
-        return await self.call_api("/models", "GET")
+        """Get list of available models (cached for an hour)"""
+        return await self._cached_get(
+            "models", 3600, lambda: self.call_api("/models", "GET"))
 
     async def get_model_endpoints(self, author: str, slug: str) -> Dict[str, Any]:
-        """Get endpoints for a specific model"""
+        """Get endpoints for a specific model (cached for an hour)"""
         if not author or not slug:
             raise ConfigurationError("Author and slug are required")
-        return await self.call_api(f"/models/{author}/{slug}/endpoints", "GET")
+        return await self._cached_get(
+            f"endpoints:{author}/{slug}", 3600,
+            lambda: self.call_api(f"/models/{author}/{slug}/endpoints", "GET"))
 
     async def get_credits(self) -> Dict[str, Any]:
-        """Get account credits information"""
-        return await self.call_api("/credits", "GET")
+        """Get account credits information (cached for 30 seconds)"""
+        return await self._cached_get(
+            "credits", 30, lambda: self.call_api("/credits", "GET"))
 
     async def health_check(self) -> bool:
-        """Check API service health status"""
-        try:
-            await self.list_models()
-            return True
-        except Exception:
-            return False
+        """Check API service health status (result cached for 10 seconds)"""
+
+        async def _probe() -> bool:
+            try:
+                await self.list_models()
+                return True
+            except Exception:
+                return False
+
+        return await self._cached_get("health", 10, _probe)
+
+    def clear_cache(self):
+        """Drop all cached query results"""
+        self._query_cache.clear()
 
     def query(self, prompt: str, **kwargs) -> str:
-        """Implement unified query interface from BaseAIProvider"""
+        """Implement unified query interface from BaseAIProvider
+
+        Results of effectively deterministic queries (temperature <= 0.01)
+        are memoized in a bounded LRU so repeated identical prompts skip the
+        network round-trip entirely; stochastic queries are never cached.
+        """
+        temperature = kwargs.get("temperature", Config.DEFAULT_TEMPERATURE)
+        cacheable = temperature is not None and temperature <= 0.01
+        key = None
+        if cacheable:
+            # Every parameter that shapes the response takes part in the
+            # key, not just temperature
+            extra = tuple(sorted(
+                (name, repr(value)) for name, value in kwargs.items()
+                if name != "temperature"))
+            key = (self.model, temperature, extra,
+                   hashlib.blake2b(prompt.encode(), digest_size=16).digest())
+            if key in self._query_cache:
+                self._query_cache.move_to_end(key)
+                return self._query_cache[key]
         try:
             messages = [{"role": "user", "content": prompt}]
-            response = asyncio.run(self.chat_completion(messages, **kwargs))
-            return self.format_response(response)
-        except Exception as e:
+            future = asyncio.run_coroutine_threadsafe(
+                self.chat_completion(messages, **kwargs), _get_query_loop())
+            response = future.result(timeout=self.timeout + 5)
+            result = self.format_response(response)
+        except OpenRouterError:
+            raise
+        except TimeoutError as e:
             raise APIError(f"Query failed: {str(e)}")
+        if cacheable:
+            self._query_cache[key] = result
+            if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return result
 
     def format_response(self, raw_response: dict) -> str:
         """Format API response"""
@@ -238,14 +634,22 @@ class OpenRouterAPI(APIBase, BaseAIProvider):
             if not prompt or not role:
                 raise ConfigurationError("Prompt and role are required")
 
-            messages = [
-                {
+            # The system message only depends on the role config; build the
+            # whole dict once per agent and memoize it on the instance so
+            # the hot path allocates only the user message
+            system_msg = getattr(role, "_system_msg", None)
+            if system_msg is None:
+                system_msg = role._system_msg = {
                     "role": "system",
-                    "content": f"You are {role.role_config.name} {role.role_config.description}"
-                },
+                    "content": (f"You are {role.role_config.name} "
+                                f"{role.role_config.description}")
+                }
+
+            messages = [
+                system_msg,
                 {
                     "role": "user",
-                    "content": role.role_config.prompt_template.format(question=prompt)
+                    "content": role.role_config.render(question=prompt)
                 }
             ]
             
@@ -259,5 +663,97 @@ class OpenRouterAPI(APIBase, BaseAIProvider):
             return self.format_response(response)
         except OpenRouterError:
             raise
-        except Exception as e:
-            raise APIError(f"Chat failed: {str(e)}") 
\ No newline at end of file
+        except (KeyError, IndexError, AttributeError) as e:
+            raise APIError(f"Chat failed: {str(e)}")
+
+    # System-prompt suffix instructing the model to answer a marshaled batch
+    _MARSHAL_INSTRUCTIONS = (
+        "Answer each numbered task independently. Reply with a JSON object "
+        '{"answers": [{"id": <task number>, "answer": <string>}, ...]} '
+        "containing exactly one entry per task.")
+
+    async def chat_completion_marshaled(self, prompt_batch: List[str],
+                                        role: Agent,
+                                        batch_size: int = 8,
+                                        **kwargs) -> List[Optional[str]]:
+        """Pack multiple prompts into single chat completions
+
+        Under a requests-per-minute rate limit, fanning prompts out in
+        parallel saturates; marshaling several logical prompts into one
+        request trades some per-call latency for higher effective
+        throughput. Prompts are numbered in the user message, the model is
+        asked for a JSON array of {id, answer} pairs, and the answers are
+        demultiplexed back into prompt order.
+
+        Args:
+            prompt_batch: Prompts to marshal
+            role (Agent): Agent configuration applied to every prompt
+            batch_size: Number of prompts packed per request
+            **kwargs: Additional parameters forwarded to chat_completion
+
+        Returns:
+            List[Optional[str]]: Answers in prompt order; prompts the model
+                did not answer yield None
+        """
+        role_config = role.role_config
+        system_content = (
+            f"You are {role_config.name} {role_config.description}. "
+            f"{self._MARSHAL_INSTRUCTIONS}")
+        results: List[Optional[str]] = [None] * len(prompt_batch)
+
+        for start in range(0, len(prompt_batch), batch_size):
+            chunk = prompt_batch[start:start + batch_size]
+            messages = [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": "\n".join(
+                    f"[{i}] {role_config.render(question=prompt)}"
+                    for i, prompt in enumerate(chunk))}
+            ]
+            response = await self.chat_completion(
+                messages,
+                temperature=role_config.temperature,
+                max_tokens=role_config.max_tokens,
+                response_format={"type": "json_object"},
+                **kwargs)
+            try:
+                payload = _json.loads(self.format_response(response))
+                # Demultiplex inside the same guard: the answer list and
+                # its items are model-controlled and just as untrusted as
+                # the envelope around them
+                for item in payload["answers"]:
+                    index = start + int(item.get("id", -1))
+                    if start <= index < start + len(chunk):
+                        results[index] = item.get("answer")
+            except (OpenRouterError, _json.DecodeError, ValueError,
+                    KeyError, TypeError, AttributeError) as e:
+                raise ResponseError(f"Invalid marshaled response: {str(e)}")
+
+        return results
+
+    async def chat_batch(self, prompts: List[str], role: Agent,
+                         concurrency: int = 32, **kwargs) -> List[str]:
+        """Run chat for many prompts concurrently through the shared session
+
+        Independent prompts are fanned out with asyncio.gather so their
+        network round-trips overlap instead of accumulating serially; an
+        asyncio.Semaphore bounds in-flight requests to respect rate limits.
+
+        Args:
+            prompts: Prompts to dispatch
+            role (Agent): Agent configuration applied to every prompt
+            concurrency: Maximum number of in-flight requests
+            **kwargs: Additional parameters forwarded to chat
+
+        Returns:
+            List[str]: Responses in prompt order; failed prompts yield their
+                exception instead of aborting the batch
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _chat_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.chat(prompt, role, **kwargs)
+
+        return await asyncio.gather(
+            *(_chat_one(prompt) for prompt in prompts),
+            return_exceptions=True) 
\ No newline at end of file
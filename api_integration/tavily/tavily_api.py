@@ -4,12 +4,23 @@ Tavily API Implementation
 This module implements the Tavily API for web search and content extraction.
 """
 
+import asyncio
+import importlib.util
 import os
+import random
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Union
 from enum import Enum
 import aiohttp
 from dotenv import load_dotenv
 
+from .. import _json
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Load environment variables
 load_dotenv()
 
@@ -39,43 +50,257 @@ class ExtractDepth(str, Enum):
     BASIC = "basic"
     ADVANCED = "advanced"
 
+def _enum_value(option):
+    """Normalize a str-or-Enum option to its wire value"""
+    return option if isinstance(option, str) else option.value
+
+
 class TavilyAPI:
     """Tavily API implementation"""
 
     BASE_URL = "https://api.tavily.com/v1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Attempts per request for retryable (429/5xx) responses
+    MAX_RETRIES = 5
+
+    def __init__(self, api_key: Optional[str] = None,
+                 max_connections: Optional[int] = None,
+                 per_host_limit: int = 30,
+                 dns_cache_ttl: int = 300):
         """
         Initialize Tavily API client
-        
+
         Args:
             api_key: Tavily API key, defaults to TAVILY_API_KEY environment variable
+            max_connections: Connection pool size, defaults to the
+                TAVILY_POOL_SIZE environment variable or 100
+            per_host_limit: Maximum concurrent connections per host
+            dns_cache_ttl: Seconds to cache DNS lookups
         """
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
         if not self.api_key:
             raise ValueError("Tavily API key not found")
+        # Pool sizing for the shared connector; TAVILY_POOL_SIZE lets ops
+        # retune batch-crawl concurrency without a code change
+        if max_connections is None:
+            max_connections = int(os.getenv("TAVILY_POOL_SIZE", "100"))
+        self._max_connections = max_connections
+        self._per_host_limit = per_host_limit
+        self._dns_cache_ttl = dns_cache_ttl
+        # Shared HTTP session, created lazily on first request and
+        # rebuilt if callers switch event loops (sessions are loop-bound)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Optional HTTP/2 transport (mirrors the OpenRouter client):
+        # multiplexes concurrent requests over one TLS connection when
+        # httpx is installed and enabled. httpx.AsyncClient(http2=True)
+        # needs the h2 extra, so probe for it too — a plain httpx
+        # install falls back to aiohttp
+        self._httpx_client = None
+        self._use_http2 = (
+            httpx is not None
+            and importlib.util.find_spec("h2") is not None
+            and os.getenv("TAVILY_HTTP2") == "1")
+        # Headers and endpoint URLs never change per instance; build them
+        # once instead of per call
+        self._headers_frozen = MappingProxyType(self._build_headers())
+        self._search_url = f"{self.BASE_URL}/search"
+        self._extract_url = f"{self.BASE_URL}/extract"
+        # Default payload fields constant-folded once (including the enum
+        # .value resolution); per-call builds start from a C-level copy
+        # and overlay only what differs
+        self._search_defaults = {
+            "topic": SearchTopic.GENERAL.value,
+            "search_depth": SearchDepth.BASIC.value,
+            "max_results": 5,
+            "include_answer": False,
+            "include_raw_content": False,
+            "include_images": False,
+            "include_image_descriptions": False,
+        }
+        self._extract_defaults = {
+            "include_images": False,
+            "extract_depth": ExtractDepth.BASIC.value,
+        }
+        # Advisory concurrency cap: halved on sustained 429s, additively
+        # recovered on success (AIMD); fan-out helpers respect it
+        self._adaptive_limit = self._max_connections
+        self._throttle_streak = 0
 
     def _build_headers(self) -> Dict[str, str]:
         """Build API request headers"""
         return {
             "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            # Chat/search responses are highly compressible text; aiohttp
+            # decompresses these transparently (brotli when available)
+            "Accept-Encoding": "gzip, deflate, br"
         }
 
-    async def _call_api(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Make API request to Tavily"""
-        url = f"{self.BASE_URL}{endpoint}"
-        
-        async with aiohttp.ClientSession(headers=self._build_headers()) as session:
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared client session, creating it on first use
+
+        One long-lived session keeps TCP keep-alive connections, TLS
+        sessions and DNS cache entries warm across calls instead of paying
+        connection setup per request.
+        """
+        loop = asyncio.get_running_loop()
+        if (self._session is None or self._session.closed
+                or self._session_loop is not loop):
+            if self._session is not None and not self._session.closed:
+                try:
+                    await self._session.close()
+                except Exception:
+                    pass
+            self._session = aiohttp.ClientSession(
+                headers=self._headers_frozen,
+                # Per-socket timeouts instead of a total deadline, so one
+                # slow host cannot stall pooled batch extractions
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=10, sock_read=30),
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_connections,
+                    limit_per_host=self._per_host_limit,
+                    ttl_dns_cache=self._dns_cache_ttl,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True))
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self):
+        """Close the shared client session and its connection pool"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._httpx_client is not None and not self._httpx_client.is_closed:
+            await self._httpx_client.aclose()
+        self._httpx_client = None
+
+    def _get_httpx_client(self):
+        """Get the shared HTTP/2 client, creating it on first use"""
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=50),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                headers=dict(self._headers_frozen))
+        return self._httpx_client
+
+    async def _call_api_http2(self, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """_call_api over the multiplexed HTTP/2 transport
+
+        Mirrors the aiohttp path's 429/5xx exponential backoff and AIMD
+        concurrency accounting so transport choice does not change retry
+        semantics.
+        """
+        body = _json.dumps(data)
+        try:
+            client = self._get_httpx_client()
+            for attempt in range(self.MAX_RETRIES):
+                response = await client.post(url, content=body)
+                if response.status_code == 200:
+                    self._note_success()
+                    return _json.loads(response.content)
+
+                if response.status_code == 429:
+                    self._note_throttle()
+                    await asyncio.sleep(self._retry_delay(response, attempt))
+                    continue
+                if 500 <= response.status_code < 600:
+                    await asyncio.sleep(min(2 ** attempt, 30))
+                    continue
+
+                try:
+                    error_data = _json.loads(response.content)
+                except _json.DecodeError:
+                    error_data = {"error": "Unknown error"}
+                raise Exception(
+                    f"API call failed: {response.status_code} - {error_data}")
+            raise Exception(f"API call failed: {self.MAX_RETRIES} retries exhausted")
+        except httpx.HTTPError as e:
+            raise Exception(f"Network request failed: {str(e)}")
+
+    def _note_throttle(self):
+        """Shrink the advisory concurrency cap on sustained rate limiting"""
+        self._throttle_streak += 1
+        if self._throttle_streak >= 2:
+            self._adaptive_limit = max(1, self._adaptive_limit // 2)
+            self._throttle_streak = 0
+
+    def _note_success(self):
+        """Additively recover the advisory concurrency cap"""
+        self._throttle_streak = 0
+        if self._adaptive_limit < self._max_connections:
+            self._adaptive_limit += 1
+
+    @staticmethod
+    async def _read_body(response: aiohttp.ClientResponse) -> bytes:
+        """Read a response body, streaming very large payloads in chunks
+
+        Multi-MB extract responses are accumulated via iter_chunked into a
+        bytearray instead of letting one contiguous buffer grow through
+        repeated reallocations; small bodies use the plain read.
+        """
+        try:
+            length = int(response.headers.get("Content-Length", 0))
+        except (TypeError, ValueError):
+            length = 0
+        if length > 1 << 20:
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(65536):
+                buffer.extend(chunk)
+            return bytes(buffer)
+        return await response.read()
+
+    @staticmethod
+    def _retry_delay(response, attempt: int) -> float:
+        """Pick a backoff delay, honoring Retry-After when present"""
+        retry_after = response.headers.get("Retry-After") if response.headers else None
+        if retry_after is not None:
             try:
-                async with session.post(url, json=data) as response:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return min(2 ** attempt, 30) + random.random()
+
+    async def _call_api(self, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make API request to Tavily, backing off on 429/5xx
+
+        Rate-limit and server errors are retried with exponential backoff
+        plus jitter (Retry-After wins when the server sends one) instead
+        of discarding the connection the caller already paid for; other
+        errors raise immediately.
+        """
+        if self._use_http2:
+            return await self._call_api_http2(url, data)
+
+        body = _json.dumps(data)
+        session = await self._get_session()
+        try:
+            for attempt in range(self.MAX_RETRIES):
+                async with session.post(url, data=body) as response:
                     if response.status == 200:
-                        return await response.json()
-                    
-                    error_data = await response.json()
+                        self._note_success()
+                        return _json.loads(await self._read_body(response))
+
+                    if response.status == 429:
+                        self._note_throttle()
+                        await asyncio.sleep(self._retry_delay(response, attempt))
+                        continue
+                    if 500 <= response.status < 600:
+                        await asyncio.sleep(min(2 ** attempt, 30))
+                        continue
+
+                    try:
+                        error_data = _json.loads(await response.read())
+                    except _json.DecodeError:
+                        error_data = {"error": "Unknown error"}
                     raise Exception(f"API call failed: {response.status} - {error_data}")
-            except aiohttp.ClientError as e:
-                raise Exception(f"Network request failed: {str(e)}")
+            raise Exception(f"API call failed: {self.MAX_RETRIES} retries exhausted")
+        except aiohttp.ClientError as e:
+            raise Exception(f"Network request failed: {str(e)}")
 
     async def search(self,
                     query: str,
@@ -116,50 +341,152 @@ class TavilyAPI:
         if days is not None and days <= 0:
             raise ValueError("days must be greater than 0")
 
-        data = {
-            "query": query,
-            "topic": topic if isinstance(topic, str) else topic.value,
-            "search_depth": search_depth if isinstance(search_depth, str) else search_depth.value,
-            "max_results": max_results,
-            "include_answer": include_answer,
-            "include_raw_content": include_raw_content,
-            "include_images": include_images,
-            "include_image_descriptions": include_image_descriptions
-        }
+        data = dict(self._search_defaults)
+        data["query"] = query
+        if topic is not SearchTopic.GENERAL:
+            data["topic"] = _enum_value(topic)
+        if search_depth is not SearchDepth.BASIC:
+            data["search_depth"] = _enum_value(search_depth)
+        if max_results != 5:
+            data["max_results"] = max_results
+        if include_answer:
+            data["include_answer"] = include_answer
+        if include_raw_content:
+            data["include_raw_content"] = include_raw_content
+        if include_images:
+            data["include_images"] = include_images
+        if include_image_descriptions:
+            data["include_image_descriptions"] = include_image_descriptions
+
+        optional = (
+            ("time_range", _enum_value(time_range) if time_range else None),
+            ("days", days),
+            ("include_domains", include_domains),
+            ("exclude_domains", exclude_domains),
+        )
+        data.update({key: value for key, value in optional if value})
+
+        return await self._call_api(self._search_url, data)
 
-        if time_range:
-            data["time_range"] = time_range if isinstance(time_range, str) else time_range.value
-        if days:
-            data["days"] = days
-        if include_domains:
-            data["include_domains"] = include_domains
-        if exclude_domains:
-            data["exclude_domains"] = exclude_domains
+    async def search_all(self,
+                        queries: List[str],
+                        *,
+                        concurrency: int = 16,
+                        **kwargs) -> List[Dict[str, Any]]:
+        """
+        Run many searches concurrently with back-pressure
+
+        Uses asyncio.TaskGroup for structured cancellation — if one query
+        fails the rest are cancelled instead of leaking sockets from the
+        shared connector pool — and a semaphore so unbounded fan-out
+        cannot degrade the session.
 
-        return await self._call_api("/search", data)
+        Args:
+            queries: Search queries to execute
+            concurrency: Maximum concurrent searches
+            **kwargs: Additional parameters forwarded to search
+
+        Returns:
+            List[Dict[str, Any]]: Search responses in query order
+        """
+        semaphore = asyncio.Semaphore(min(concurrency, self._adaptive_limit))
+
+        async def _search_one(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.search(query, **kwargs)
+
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(_search_one(query))
+                     for query in queries]
+        return [task.result() for task in tasks]
 
     async def extract(self,
                      urls: Union[str, List[str]],
                      include_images: bool = False,
-                     extract_depth: Union[str, ExtractDepth] = ExtractDepth.BASIC) -> Dict[str, Any]:
+                     extract_depth: Union[str, ExtractDepth] = ExtractDepth.BASIC,
+                     chunk_size: int = 5,
+                     max_concurrency: int = 8) -> Dict[str, Any]:
         """
         Extract web page content from URLs
-        
+
+        URL lists longer than chunk_size are split into chunks extracted
+        concurrently (bounded by max_concurrency) so server-side extraction
+        overlaps across requests; their results are merged and deduplicated
+        by URL. Shorter lists go out as a single request.
+
         Args:
             urls: Single URL or list of URLs to extract content from
             include_images: Include list of extracted images
             extract_depth: Depth of extraction process
-            
+            chunk_size: Maximum URLs per request
+            max_concurrency: Maximum concurrent chunk requests
+
         Returns:
             Extracted content including raw content and images
         """
         if isinstance(urls, str):
             urls = [urls]
+        depth = _enum_value(extract_depth)
 
-        data = {
-            "urls": urls,
-            "include_images": include_images,
-            "extract_depth": extract_depth if isinstance(extract_depth, str) else extract_depth.value
-        }
+        if len(urls) <= chunk_size:
+            data = dict(self._extract_defaults)
+            data["urls"] = urls
+            if include_images:
+                data["include_images"] = include_images
+            if depth != ExtractDepth.BASIC.value:
+                data["extract_depth"] = depth
+            return await self._call_api(self._extract_url, data)
+
+        semaphore = asyncio.Semaphore(min(max_concurrency, self._adaptive_limit))
+
+        async def _extract_chunk(chunk: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._call_api(self._extract_url, {
+                    "urls": chunk,
+                    "include_images": include_images,
+                    "extract_depth": depth
+                })
+
+        # TaskGroup for structured cancellation, matching search_all: one
+        # failing chunk cancels the rest instead of leaving them running
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(_extract_chunk(urls[i:i + chunk_size]))
+                     for i in range(0, len(urls), chunk_size)]
+        responses = [task.result() for task in tasks]
+
+        merged: List[Dict[str, Any]] = []
+        seen = set()
+        for response in responses:
+            for result in response.get("results", []):
+                url = result.get("url")
+                if url not in seen:
+                    seen.add(url)
+                    merged.append(result)
+        return {"results": merged}
 
-        return await self._call_api("/extract", data) 
\ No newline at end of file
+    async def extract_many(self,
+                          urls: List[str],
+                          *,
+                          chunk: int = 32,
+                          concurrency: int = 8,
+                          **kwargs) -> List[Dict[str, Any]]:
+        """
+        Extract a large URL set and return the flat results list
+
+        Convenience wrapper over extract() tuned for bulk workloads:
+        server-side batches of 32-128 URLs amortize the HTTPS and JSON
+        overhead well, while the bounded gather overlaps extraction across
+        requests.
+
+        Args:
+            urls: URLs to extract content from
+            chunk: Maximum URLs per request
+            concurrency: Maximum concurrent chunk requests
+            **kwargs: Additional parameters forwarded to extract
+
+        Returns:
+            List[Dict[str, Any]]: Deduplicated extraction results
+        """
+        response = await self.extract(
+            urls, chunk_size=chunk, max_concurrency=concurrency, **kwargs)
+        return response.get("results", []) 
\ No newline at end of file
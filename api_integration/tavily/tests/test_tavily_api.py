@@ -5,8 +5,7 @@ Unit Tests for Tavily API Implementation
 import os
 import json
 import unittest
-from unittest.mock import patch, MagicMock
-from typing import Dict, Any
+from unittest.mock import patch, MagicMock, AsyncMock
 
 from ..tavily_api import (
     TavilyAPI,
@@ -17,7 +16,19 @@ from ..tavily_api import (
 )
 
 
-class TestTavilyAPI(unittest.TestCase):
+def _mock_response(status: int, payload) -> MagicMock:
+    """Build an async-context-manager mock around a response payload"""
+    response = AsyncMock()
+    response.status = status
+    response.headers = {}
+    response.read = AsyncMock(return_value=json.dumps(payload).encode("utf-8"))
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return context
+
+
+class TestTavilyAPI(unittest.IsolatedAsyncioTestCase):
     """Test cases for TavilyAPI"""
 
     def setUp(self):
@@ -43,8 +54,8 @@ class TestTavilyAPI(unittest.TestCase):
         self.assertEqual(headers["Authorization"], f"Bearer {self.api_key}")
         self.assertEqual(headers["Content-Type"], "application/json")
 
-    @patch("aiohttp.ClientSession")
-    async def test_search_basic(self, mock_session):
+    @patch.object(TavilyAPI, "_get_session")
+    async def test_search_basic(self, mock_get_session):
         """Test basic search functionality"""
         # Mock response
         mock_response = {
@@ -57,42 +68,35 @@ class TestTavilyAPI(unittest.TestCase):
                 }
             ]
         }
-        
-        # Setup mock
-        mock_context = MagicMock()
-        mock_context.__aenter__.return_value.status = 200
-        mock_context.__aenter__.return_value.json = MagicMock(
-            return_value=mock_response
-        )
-        mock_session.return_value.post.return_value = mock_context
+
+        # Setup mock session
+        mock_session = mock_get_session.return_value
+        mock_session.post = MagicMock(
+            return_value=_mock_response(200, mock_response))
 
         # Test search
         result = await self.api.search("test query")
-        
+
         # Verify request
-        mock_session.return_value.post.assert_called_once()
-        call_args = mock_session.return_value.post.call_args
+        mock_session.post.assert_called_once()
+        call_args = mock_session.post.call_args
         self.assertEqual(call_args[0][0], f"{TavilyAPI.BASE_URL}/search")
-        
+
         # Verify request data
-        request_data = json.loads(call_args[1]["json"])
+        request_data = json.loads(call_args[1]["data"])
         self.assertEqual(request_data["query"], "test query")
         self.assertEqual(request_data["topic"], SearchTopic.GENERAL.value)
         self.assertEqual(request_data["search_depth"], SearchDepth.BASIC.value)
-        
+
         # Verify response
         self.assertEqual(result, mock_response)
 
-    @patch("aiohttp.ClientSession")
-    async def test_search_advanced(self, mock_session):
+    @patch.object(TavilyAPI, "_get_session")
+    async def test_search_advanced(self, mock_get_session):
         """Test advanced search functionality"""
-        mock_response = {"status": "success"}
-        mock_context = MagicMock()
-        mock_context.__aenter__.return_value.status = 200
-        mock_context.__aenter__.return_value.json = MagicMock(
-            return_value=mock_response
-        )
-        mock_session.return_value.post.return_value = mock_context
+        mock_session = mock_get_session.return_value
+        mock_session.post = MagicMock(
+            return_value=_mock_response(200, {"status": "success"}))
 
         result = await self.api.search(
             query="test query",
@@ -106,8 +110,8 @@ class TestTavilyAPI(unittest.TestCase):
         )
 
         # Verify request data
-        call_args = mock_session.return_value.post.call_args
-        request_data = json.loads(call_args[1]["json"])
+        call_args = mock_session.post.call_args
+        request_data = json.loads(call_args[1]["data"])
         self.assertEqual(request_data["topic"], SearchTopic.NEWS.value)
         self.assertEqual(request_data["search_depth"], SearchDepth.ADVANCED.value)
         self.assertEqual(request_data["max_results"], 10)
@@ -115,21 +119,21 @@ class TestTavilyAPI(unittest.TestCase):
         self.assertEqual(request_data["days"], 7)
         self.assertTrue(request_data["include_answer"])
         self.assertTrue(request_data["include_images"])
+        self.assertEqual(result, {"status": "success"})
 
-    @patch("aiohttp.ClientSession")
-    async def test_search_validation(self, mock_session):
+    async def test_search_validation(self):
         """Test search parameter validation"""
         with self.assertRaises(ValueError):
             await self.api.search("test", max_results=0)
-        
+
         with self.assertRaises(ValueError):
             await self.api.search("test", max_results=20)
-            
+
         with self.assertRaises(ValueError):
             await self.api.search("test", days=0)
 
-    @patch("aiohttp.ClientSession")
-    async def test_extract_single_url(self, mock_session):
+    @patch.object(TavilyAPI, "_get_session")
+    async def test_extract_single_url(self, mock_get_session):
         """Test content extraction for single URL"""
         mock_response = {
             "results": [{
@@ -137,27 +141,25 @@ class TestTavilyAPI(unittest.TestCase):
                 "raw_content": "Test content"
             }]
         }
-        
-        mock_context = MagicMock()
-        mock_context.__aenter__.return_value.status = 200
-        mock_context.__aenter__.return_value.json = MagicMock(
-            return_value=mock_response
-        )
-        mock_session.return_value.post.return_value = mock_context
+
+        mock_session = mock_get_session.return_value
+        mock_session.post = MagicMock(
+            return_value=_mock_response(200, mock_response))
 
         result = await self.api.extract("https://test.com")
-        
+
         # Verify request
-        call_args = mock_session.return_value.post.call_args
-        request_data = json.loads(call_args[1]["json"])
+        call_args = mock_session.post.call_args
+        self.assertEqual(call_args[0][0], f"{TavilyAPI.BASE_URL}/extract")
+        request_data = json.loads(call_args[1]["data"])
         self.assertEqual(request_data["urls"], ["https://test.com"])
         self.assertEqual(request_data["extract_depth"], ExtractDepth.BASIC.value)
-        
+
         # Verify response
         self.assertEqual(result, mock_response)
 
-    @patch("aiohttp.ClientSession")
-    async def test_extract_multiple_urls(self, mock_session):
+    @patch.object(TavilyAPI, "_get_session")
+    async def test_extract_multiple_urls(self, mock_get_session):
         """Test content extraction for multiple URLs"""
         urls = ["https://test1.com", "https://test2.com"]
         mock_response = {
@@ -166,45 +168,56 @@ class TestTavilyAPI(unittest.TestCase):
                 for url in urls
             ]
         }
-        
-        mock_context = MagicMock()
-        mock_context.__aenter__.return_value.status = 200
-        mock_context.__aenter__.return_value.json = MagicMock(
-            return_value=mock_response
-        )
-        mock_session.return_value.post.return_value = mock_context
+
+        mock_session = mock_get_session.return_value
+        mock_session.post = MagicMock(
+            return_value=_mock_response(200, mock_response))
 
         result = await self.api.extract(
             urls,
             include_images=True,
             extract_depth=ExtractDepth.ADVANCED
         )
-        
+
         # Verify request
-        call_args = mock_session.return_value.post.call_args
-        request_data = json.loads(call_args[1]["json"])
+        call_args = mock_session.post.call_args
+        request_data = json.loads(call_args[1]["data"])
         self.assertEqual(request_data["urls"], urls)
         self.assertTrue(request_data["include_images"])
         self.assertEqual(request_data["extract_depth"], ExtractDepth.ADVANCED.value)
-        
+
         # Verify response
         self.assertEqual(result, mock_response)
 
-    @patch("aiohttp.ClientSession")
-    async def test_api_error_handling(self, mock_session):
+    @patch.object(TavilyAPI, "_get_session")
+    async def test_extract_chunked(self, mock_get_session):
+        """Test chunked extraction merges and deduplicates results"""
+        urls = [f"https://test{i}.com" for i in range(6)]
+        mock_session = mock_get_session.return_value
+        mock_session.post = MagicMock(side_effect=lambda url, data: _mock_response(
+            200, {"results": [
+                {"url": u, "raw_content": f"Content from {u}"}
+                for u in json.loads(data)["urls"]
+            ]}))
+
+        result = await self.api.extract(urls, chunk_size=5)
+
+        # Two chunk requests, all URLs present exactly once
+        self.assertEqual(mock_session.post.call_count, 2)
+        self.assertEqual([r["url"] for r in result["results"]], urls)
+
+    @patch.object(TavilyAPI, "_get_session")
+    async def test_api_error_handling(self, mock_get_session):
         """Test API error handling"""
-        mock_context = MagicMock()
-        mock_context.__aenter__.return_value.status = 400
-        mock_context.__aenter__.return_value.json = MagicMock(
-            return_value={"error": "Bad request"}
-        )
-        mock_session.return_value.post.return_value = mock_context
+        mock_session = mock_get_session.return_value
+        mock_session.post = MagicMock(
+            return_value=_mock_response(400, {"error": "Bad request"}))
 
         with self.assertRaises(Exception) as context:
             await self.api.search("test query")
-        
+
         self.assertIn("API call failed", str(context.exception))
 
 
 if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tokenizer Package
+
+This package provides the tokenizer implementations and a process-wide
+tokenizer service. Exports resolve lazily (PEP 562) so importing the
+package pulls in no heavyweight dependencies, and the default service is
+only created on the first get_tokenizer call.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib import import_module
+
+__all__ = [
+    'Tokenizer',
+    'TokenizerError',
+    'TokenizerBase',
+    'DeepSeekTokenizer',
+    'TokenizerService',
+    'get_tokenizer',
+]
+
+_default_service = None
+
+
+def _get_default_service():
+    """Create the shared TokenizerService on first use"""
+    global _default_service
+    if _default_service is None:
+        from .tokenizer_service import TokenizerService
+        _default_service = TokenizerService()
+    return _default_service
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(name: str, model_dir: str | None = None):
+    """Get a shared tokenizer instance from the default service
+
+    The lru_cache turns repeat lookups — typically one per API request —
+    into a single C-level cache hit, skipping the service's dict lookup
+    and lock check entirely. The service itself stays the source of
+    truth, so register_tokenizer plus a fresh (name, model_dir) pair
+    still resolves through it.
+    """
+    return _get_default_service().get_tokenizer(name, model_dir)
+
+
+# Export name -> (module, attribute) for lazy resolution
+_LAZY_EXPORTS = {
+    'Tokenizer': ('tokenizer', 'Tokenizer'),
+    'TokenizerError': ('tokenizer', 'TokenizerError'),
+    'TokenizerBase': ('tokenizer_base', 'TokenizerBase'),
+    'DeepSeekTokenizer': ('deepseek_tokenizer', 'DeepSeekTokenizer'),
+    'TokenizerService': ('tokenizer_service', 'TokenizerService'),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    value = getattr(import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
@@ -0,0 +1,86 @@
+"""
+Shared-Memory BPE Rank Distribution
+
+In multi-process servers every worker that builds the o200k_base encoding
+parses the ~200k-entry merge table into its own RSS. These helpers let the
+parent process publish the parsed ranks once in a read-only shared-memory
+segment; workers attach and rebuild the encoding from the shared bytes
+instead of re-reading the table.
+
+Enabled via TOKENIZER_SHM=1. The segment name is published through the
+TOKENIZER_SHM_NAME environment variable so spawned workers inherit it.
+"""
+import os
+import pickle
+from multiprocessing import shared_memory
+
+_ENV_FLAG = "TOKENIZER_SHM"
+_ENV_NAME = "TOKENIZER_SHM_NAME"
+
+
+def enabled() -> bool:
+    """Whether shared-memory rank distribution is switched on"""
+    return os.getenv(_ENV_FLAG) == "1"
+
+
+def build_shm_ranks(encoding_name: str = "o200k_base") -> str:
+    """
+    Publish an encoding's merge table in shared memory (parent process)
+
+    Loads the encoding once, pickles its pattern and mergeable ranks into
+    a SharedMemory segment, and records the segment name in the
+    environment for workers to pick up.
+
+    Args:
+        encoding_name: tiktoken encoding to publish
+
+    Returns:
+        str: Name of the created shared-memory segment
+    """
+    import tiktoken
+
+    encoding = tiktoken.get_encoding(encoding_name)
+    payload = pickle.dumps(
+        {
+            "pat_str": encoding._pat_str,
+            "mergeable_ranks": encoding._mergeable_ranks,
+        },
+        protocol=pickle.HIGHEST_PROTOCOL)
+    shm = shared_memory.SharedMemory(create=True, size=len(payload))
+    shm.buf[:len(payload)] = payload
+    shm.close()
+    os.environ[_ENV_NAME] = shm.name
+    return shm.name
+
+
+def load_shared_encoding(encoding_name: str):
+    """
+    Rebuild an encoding from the published segment (worker process)
+
+    Args:
+        encoding_name: Name for the reconstructed encoding
+
+    Returns:
+        The reconstructed tiktoken.Encoding, or None when no segment has
+        been published or it is gone
+    """
+    name = os.getenv(_ENV_NAME)
+    if not name:
+        return None
+    import tiktoken
+
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return None
+    try:
+        # pickle stops at the end of its stream, so any allocation
+        # rounding after the payload is ignored
+        data = pickle.loads(bytes(shm.buf))
+    finally:
+        shm.close()
+    return tiktoken.Encoding(
+        name=encoding_name,
+        pat_str=data["pat_str"],
+        mergeable_ranks=data["mergeable_ranks"],
+        special_tokens={})
@@ -0,0 +1,106 @@
+"""
+DeepSeek Tokenizer Implementation
+
+Counts tokens using the DeepSeek tokenizer files through the HuggingFace
+fast (Rust-backed) tokenizer.
+"""
+from __future__ import annotations
+
+import functools
+import os
+
+from .tokenizer_base import TokenizerBase
+
+# Resolved once at import so each construction skips the abspath/dirname
+# path work
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class DeepSeekTokenizer(TokenizerBase):
+    """Tokenizer backed by the DeepSeek HuggingFace tokenizer files"""
+
+    def __init__(self, model_dir: str | None = None):
+        """
+        Initialize the tokenizer from a local model directory
+
+        Args:
+            model_dir: Directory containing the tokenizer files
+                (tokenizer.json / tokenizer_config.json); defaults to
+                this module's directory
+
+        Raises:
+            FileNotFoundError: If the directory holds no tokenizer files
+        """
+        if model_dir is None:
+            model_dir = _THIS_DIR
+        # Fail with a clear message up front: without tokenizer files the
+        # HF load (local_files_only) can only produce an opaque error
+        if not any(os.path.exists(os.path.join(model_dir, name))
+                   for name in ("tokenizer.json", "tokenizer_config.json")):
+            raise FileNotFoundError(
+                f"No tokenizer files found in {model_dir}; pass model_dir "
+                "pointing at a directory with the DeepSeek tokenizer files")
+
+        # Deferred import: transformers costs seconds and hundreds of MB
+        # to import, and only DeepSeekTokenizer users should pay for it
+        from transformers import AutoTokenizer
+
+        # use_fast selects the Rust-backed tokenizer implementation;
+        # local_files_only keeps HF from probing the hub over the network
+        # for files that ship with the package
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            model_dir, trust_remote_code=True, use_fast=True,
+            local_files_only=True)
+        # Identical prompts are re-counted constantly; memoize per instance
+        # so cache hits skip the tokenizer entirely
+        self._count_cached = functools.lru_cache(maxsize=4096)(self._count_uncached)
+
+    def encode(self, text: str) -> list[int]:
+        """Encode text into a list of token ids"""
+        return self.tokenizer.encode(text, add_special_tokens=False)
+
+    def decode(self, tokens: list[int]) -> str:
+        """Decode a list of token ids back into text"""
+        return self.tokenizer.decode(tokens)
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count the number of tokens in a text string
+
+        Goes through the fast tokenizer's backend directly so the encode
+        stays in the Rust tokenizers layer; only the length crosses back,
+        instead of boxing every id into a Python int first.
+
+        Args:
+            text: The input text to tokenize
+
+        Returns:
+            int: Number of tokens
+        """
+        return self._count_cached(text)
+
+    def _count_uncached(self, text: str) -> int:
+        """Tokenize and count without consulting the cache"""
+        backend = getattr(self.tokenizer, "backend_tokenizer", None)
+        if backend is not None:
+            return len(backend.encode(text, add_special_tokens=False).ids)
+        return len(self.tokenizer(
+            text, add_special_tokens=False,
+            return_attention_mask=False)["input_ids"])
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """
+        Count tokens for a batch of texts
+
+        Passing the whole list to the tokenizer pushes the loop into the
+        Rust layer instead of crossing the FFI boundary per text.
+
+        Args:
+            texts: The input texts to tokenize
+
+        Returns:
+            list[int]: Number of tokens per input text
+        """
+        encoded = self.tokenizer(
+            texts, add_special_tokens=False, return_attention_mask=False)
+        return [len(ids) for ids in encoded["input_ids"]]
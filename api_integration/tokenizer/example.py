@@ -1,4 +1,4 @@
-from tokenizer import Tokenizer, TokenizerError
+from api_integration.tokenizer import Tokenizer, TokenizerError
 
 def main():
     # Create a tokenizer instance (uses o200k_base encoding)
@@ -0,0 +1,124 @@
+"""
+Unit Tests for Tokenizer Implementations
+"""
+
+import unittest
+
+from ..deepseek_tokenizer import DeepSeekTokenizer
+from ..tokenizer_base import TokenizerBase
+from ..tokenizer_service import TokenizerService
+
+
+class MockTokenizer(TokenizerBase):
+    """Minimal in-memory tokenizer for exercising the base interface"""
+
+    def count_tokens(self, text: str) -> int:
+        return len(text.split())
+
+
+# The mock is stateless; one module-level instance serves every test
+# instead of re-allocating per method
+_MOCK = MockTokenizer()
+
+
+class TestTokenizerBase(unittest.TestCase):
+    """Test cases for the TokenizerBase interface"""
+
+    tokenizer = _MOCK
+
+    def test_count_tokens(self):
+        """Test single-text counting through the interface"""
+        self.assertEqual(self.tokenizer.count_tokens("one two three"), 3)
+
+    def test_count_tokens_empty(self):
+        """Test counting an empty string"""
+        self.assertEqual(self.tokenizer.count_tokens(""), 0)
+
+    def test_count_tokens_batch_default(self):
+        """Test the default batch implementation loops over count_tokens"""
+        texts = ["one", "one two", "one two three"]
+        self.assertEqual(self.tokenizer.count_tokens_batch(texts), [1, 2, 3])
+
+    def test_count_tokens_batch_empty(self):
+        """Test batch counting with no texts"""
+        self.assertEqual(self.tokenizer.count_tokens_batch([]), [])
+
+    def test_abstract_instantiation(self):
+        """Test that the base class cannot be instantiated"""
+        with self.assertRaises(TypeError):
+            TokenizerBase()
+
+
+class TestDeepSeekTokenizer(unittest.TestCase):
+    """Test cases for DeepSeekTokenizer
+
+    The HuggingFace tokenizer load dominates each test's runtime, so one
+    instance is shared class-wide; tests must stay read-only on it.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the tokenizer once for all tests, skipping when unavailable
+
+        Construction is the real precondition: it fails both when
+        transformers is not installed and when no tokenizer files exist
+        at the model directory.
+        """
+        try:
+            cls.tokenizer = DeepSeekTokenizer()
+        except Exception as e:
+            raise unittest.SkipTest(f"DeepSeek tokenizer unavailable: {e}")
+
+    def test_count_tokens(self):
+        """Test token counting"""
+        self.assertGreater(self.tokenizer.count_tokens("Hello, world!"), 0)
+
+    def test_count_matches_encode(self):
+        """Test count_tokens agrees with the encode path"""
+        text = "Hello, world!"
+        self.assertEqual(
+            self.tokenizer.count_tokens(text),
+            len(self.tokenizer.encode(text)))
+
+    def test_encode_decode_roundtrip(self):
+        """Test encoding and decoding round-trips"""
+        text = "Hello, world!"
+        self.assertEqual(
+            self.tokenizer.decode(self.tokenizer.encode(text)), text)
+
+    def test_count_tokens_batch(self):
+        """Test batch counting agrees with single counts"""
+        texts = ["Hello, world!", "A longer sentence with more tokens."]
+        self.assertEqual(
+            self.tokenizer.count_tokens_batch(texts),
+            [self.tokenizer.count_tokens(text) for text in texts])
+
+
+class TestTokenizerService(unittest.TestCase):
+    """Test cases for TokenizerService"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build and configure one service for all tests"""
+        cls.service = TokenizerService()
+        cls.service.register_tokenizer("mock", MockTokenizer)
+
+    def test_get_registered_tokenizer(self):
+        """Test retrieving a registered tokenizer"""
+        tokenizer = self.service.get_tokenizer("mock")
+        self.assertIsInstance(tokenizer, MockTokenizer)
+
+    def test_instances_are_shared(self):
+        """Test repeated lookups return the same instance"""
+        self.assertIs(
+            self.service.get_tokenizer("mock"),
+            self.service.get_tokenizer("mock"))
+
+    def test_unknown_tokenizer(self):
+        """Test unknown names raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.service.get_tokenizer("nonexistent")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,40 +1,97 @@
+from __future__ import annotations
+
+import functools
+import os
+
 import tiktoken
 
+from . import _shared_ranks
+from .tokenizer_base import TokenizerBase
+
 class TokenizerError(Exception):
     """Custom exception for tokenizer-related errors."""
     pass
 
-class Tokenizer:
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(name: str):
+    """Load a tiktoken encoding once per process
+
+    tiktoken.get_encoding re-reads and parses the multi-MB BPE merge
+    table on every call; memoizing it lets all Tokenizer instances share
+    a single encoding object. With TOKENIZER_SHM=1 the ranks are attached
+    from the parent's shared-memory segment instead of being re-parsed
+    per worker process.
+    """
+    if _shared_ranks.enabled():
+        encoding = _shared_ranks.load_shared_encoding(name)
+        if encoding is not None:
+            return encoding
+    return tiktoken.get_encoding(name)
+
+
+class Tokenizer(TokenizerBase):
     """A class to handle text tokenization operations using o200k_base encoding"""
-    
+
     ENCODING_NAME = "o200k_base"
-    
+
     def __init__(self):
         """
         Initialize the tokenizer with o200k_base encoding
-        
+
         Raises:
             TokenizerError: If the encoding initialization fails
         """
         try:
-            self.encoding = tiktoken.get_encoding(self.ENCODING_NAME)
+            self.encoding = _get_encoding(self.ENCODING_NAME)
         except Exception as e:
             raise TokenizerError(f"Failed to initialize tokenizer: {str(e)}")
+        # Identical prompts (role/system templates) are re-counted
+        # constantly; memoize per instance so cache hits skip the BPE scan
+        self._count_cached = functools.lru_cache(maxsize=4096)(self._count_uncached)
 
     def count_tokens(self, text: str) -> int:
         """
         Count the number of tokens in a text string
-        
+
         Args:
             text: The input text to tokenize
-            
+
         Returns:
             int: Number of tokens
-            
+
+        Raises:
+            TokenizerError: If tokenization fails
+        """
+        try:
+            return self._count_cached(text)
+        except Exception as e:
+            raise TokenizerError(f"Failed to count tokens: {str(e)}")
+
+    def _count_uncached(self, text: str) -> int:
+        """Tokenize and count without consulting the cache"""
+        # encode_ordinary skips the special-token regex scan, which
+        # this API never exposes anyway
+        return len(self.encoding.encode_ordinary(text))
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """
+        Count tokens for a batch of texts in one FFI call
+
+        encode_ordinary_batch tokenizes the whole batch inside tiktoken's
+        threaded Rust layer, amortizing the per-call crossing overhead.
+
+        Args:
+            texts: The input texts to tokenize
+
+        Returns:
+            list[int]: Number of tokens per input text
+
         Raises:
             TokenizerError: If tokenization fails
         """
         try:
-            return len(self.encoding.encode(text))
+            return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(
+                texts, num_threads=os.cpu_count() or 1)]
         except Exception as e:
             raise TokenizerError(f"Failed to count tokens: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Abstract Base Class for Tokenizers
+
+This module defines the common interface for tokenizer implementations,
+so consumers can count tokens without depending on the backing library.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class TokenizerBase(ABC):
+    """Abstract base class for tokenizer implementations"""
+
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
+        """
+        Count the number of tokens in a text string
+
+        Args:
+            text: The input text to tokenize
+
+        Returns:
+            int: Number of tokens
+        """
+        pass
+
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """
+        Count tokens for a batch of texts
+
+        The default implementation loops over count_tokens; implementations
+        backed by a native batch API should override this so the whole batch
+        is tokenized in one call.
+
+        Args:
+            texts: The input texts to tokenize
+
+        Returns:
+            list[int]: Number of tokens per input text
+        """
+        return [self.count_tokens(text) for text in texts]
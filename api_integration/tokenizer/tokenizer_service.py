@@ -0,0 +1,74 @@
+"""
+Tokenizer Service
+
+Registry that builds and shares tokenizer instances by name, so
+heavyweight tokenizers are constructed at most once per process.
+"""
+from __future__ import annotations
+
+import threading
+
+from .tokenizer_base import TokenizerBase
+from .tokenizer import Tokenizer
+
+
+class TokenizerService:
+    """Thread-safe registry of shared tokenizer instances
+
+    Only tokenizers that work out of the box are pre-registered; model-
+    file-backed implementations like DeepSeekTokenizer need a real model
+    directory, so callers register them with register_tokenizer and pass
+    model_dir explicitly.
+    """
+
+    def __init__(self):
+        self._tokenizer_classes: dict[str, type[TokenizerBase]] = {
+            "o200k_base": Tokenizer,
+        }
+        self._tokenizers: dict[tuple[str, str | None], TokenizerBase] = {}
+        self._lock = threading.Lock()
+
+    def register_tokenizer(self, name: str, tokenizer_class: type[TokenizerBase]):
+        """
+        Register a tokenizer implementation under a name
+
+        Args:
+            name: Name to register the tokenizer under
+            tokenizer_class: TokenizerBase subclass to instantiate on demand
+        """
+        self._tokenizer_classes[name] = tokenizer_class
+
+    def get_tokenizer(self, name: str,
+                      model_dir: str | None = None) -> TokenizerBase:
+        """
+        Get the shared tokenizer instance for a name, building it once
+
+        Uses double-checked locking: the fast path is a plain dict read,
+        and the lock only guards first construction so concurrent callers
+        cannot double-load a heavyweight tokenizer (a DeepSeek load takes
+        seconds and hundreds of MB). Instances are keyed by
+        (name, model_dir) so different model directories do not collide.
+
+        Args:
+            name: Registered tokenizer name
+            model_dir: Optional model directory for tokenizers that take one
+
+        Returns:
+            TokenizerBase: The shared tokenizer instance
+
+        Raises:
+            ValueError: If no tokenizer is registered under the name
+        """
+        key = (name, model_dir)
+        instance = self._tokenizers.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._tokenizers.get(key)
+                if instance is None:
+                    tokenizer_class = self._tokenizer_classes.get(name)
+                    if tokenizer_class is None:
+                        raise ValueError(f"Unknown tokenizer: {name}")
+                    instance = (tokenizer_class(model_dir)
+                                if model_dir is not None else tokenizer_class())
+                    self._tokenizers[key] = instance
+        return instance
@@ -83,6 +83,7 @@ class Deepcision:
         try:
             self.reasoning_engine.shutdown()
             self.role_manager.terminate_all_agents()
+            await self.api_manager.shutdown()
             self.config_loader.shutdown()
         except Exception as e:
             print(f"Error during system shutdown: {str(e)}")
@@ -0,0 +1,40 @@
+"""
+JSON Helpers for Configuration I/O
+
+Selects the fastest installed codec for parsing and serializing config
+files: msgspec's C-level decoder first, then orjson (Rust-backed,
+SIMD-accelerated), then the stdlib json module.
+
+loads accepts bytes directly, so config files can be opened in binary
+mode and skip the TextIOWrapper decode pass. dumps_pretty returns
+indented UTF-8 bytes for human-editable config files (msgspec/orjson
+offer 2-space indent; the stdlib fallback keeps the traditional 4).
+"""
+
+try:
+    from msgspec import json as _msgspec_json
+
+    loads = _msgspec_json.decode
+
+    def dumps_pretty(obj) -> bytes:
+        """Serialize obj to indented UTF-8 JSON bytes"""
+        return _msgspec_json.format(_msgspec_json.encode(obj), indent=2)
+
+except ImportError:
+    try:
+        import orjson
+
+        loads = orjson.loads
+
+        def dumps_pretty(obj) -> bytes:
+            """Serialize obj to indented UTF-8 JSON bytes"""
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    except ImportError:
+        import json
+
+        loads = json.loads
+
+        def dumps_pretty(obj) -> bytes:
+            """Serialize obj to indented UTF-8 JSON bytes"""
+            return json.dumps(obj, indent=4).encode("utf-8")
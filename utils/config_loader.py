@@ -2,24 +2,127 @@
 Configuration Loading Utility
 Responsible for loading and managing project configuration
 """
-import json
+import mmap
+import os
+import sys
+import threading
+from collections import ChainMap
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Mapping, Optional
 
 from api_integration.api_abstract import ApiConfig
+from utils import _json
 from utils.architecture import Component
 
+# Lazily imported yaml module and loader; JSON-only deployments never
+# pay PyYAML's import cost or its C extension's RSS
+_yaml = None
+
+
+def _get_yaml():
+    """Import yaml on first use, preferring libyaml's C loader
+
+    CSafeLoader is typically 5-10x faster than the pure-Python
+    SafeLoader; fall back when PyYAML was built without libyaml.
+    """
+    global _yaml
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+        _yaml = (yaml, loader)
+    return _yaml
+
+
+# Config file suffixes recognized when loading from a directory
+_CONFIG_SUFFIXES = ('.json', '.yaml', '.yml')
+
+
+def _parse_file(path: str) -> Dict[str, Any]:
+    """Parse a single JSON or YAML config file"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if path.endswith('.json'):
+        return _json.loads(raw)
+    yaml, yaml_loader = _get_yaml()
+    return yaml.load(raw, Loader=yaml_loader) or {}
+
+
+@lru_cache(maxsize=32)
+def _parse_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file once per on-disk version
+
+    Keyed by (path, mtime, size), so re-initializing against an unchanged
+    file is a cache hit instead of a re-read and re-parse; the parsed dict
+    is shared across ConfigLoader instances in the process. The bytes come
+    straight off a read-only memory map — no TextIOWrapper, no UTF-8
+    decode pass; the parser validates UTF-8 itself.
+    """
+    if size == 0:
+        return {}
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _json.loads(bytes(mapped))
+
 
 class ConfigLoader(Component):
-    """Configuration Loader"""
+    """Configuration Loader
+
+    One loader exists per config path: construction returns the cached
+    instance, so however many subsystems build a loader, each path is
+    parsed once per process.
+    """
+
+    # Window within which burst saves coalesce into one disk write
+    FLUSH_INTERVAL = 0.2
+
+    # Path -> shared instance registry backing the per-path singleton
+    _INSTANCES: Dict[Path, "ConfigLoader"] = {}
+
+    def __new__(cls, config_file: str = "config.json"):
+        path = Path(config_file)
+        instance = cls._INSTANCES.get(path)
+        if instance is None:
+            instance = cls._INSTANCES[path] = super().__new__(cls)
+        return instance
 
     def __init__(self, config_file: str = "config.json"):
+        # Re-constructing the shared instance must not reset its state
+        if self.__dict__.get("_constructed"):
+            return
+        self._constructed = True
         self.config_file = Path(config_file)
-        self.config: Dict[str, ApiConfig] = {}
+        # Immutable snapshot of the typed config; swapped wholesale on
+        # reloads so readers never observe a half-updated mapping
+        self._snapshot: Mapping[str, ApiConfig] = MappingProxyType({})
+        # Raw entries as a ChainMap: the front layer is a single mutable
+        # overlay holding saved keys, and each loaded file contributes
+        # its own layer behind it — per-source provenance is preserved,
+        # merging a file is an O(1) insert, and repeated saves update the
+        # overlay in place instead of growing the layer list
+        self._save_overlay: Dict[str, Any] = {}
+        self._raw_config: ChainMap = ChainMap(self._save_overlay)
+        # Write-behind state: saves mark the config dirty and a timer
+        # flushes the burst in one serialized dump
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
         self.initialized: bool = False
 
+    @property
+    def config(self) -> Mapping[str, ApiConfig]:
+        """Read-only view of the current configuration snapshot"""
+        return self._snapshot
+
     def initialize(self) -> bool:
         """Initialize configuration loader"""
+        if self.initialized:
+            return True
         try:
             self.load_configs()
             self.initialized = True
@@ -31,7 +134,10 @@ class ConfigLoader(Component):
     def shutdown(self) -> bool:
         """Shutdown configuration loader"""
         try:
-            self.config.clear()
+            self.flush()
+            self._snapshot = MappingProxyType({})
+            self._save_overlay.clear()
+            self._raw_config.maps[:] = [self._save_overlay]
             self.initialized = False
             return True
         except Exception:
@@ -39,28 +145,157 @@ class ConfigLoader(Component):
 
     def get_config(self, key: str) -> Optional[ApiConfig]:
         """Get configuration item"""
-        return self.config.get(key)
+        return self._snapshot.get(key)
+
+    def get_raw_config(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the raw mapping behind a configuration item
+
+        For consumers that need provider-specific fields beyond the
+        common ApiConfig record.
+        """
+        return self._raw_config.get(key)
+
+    def get_configs(self, keys: Iterable[str]) -> Dict[str, Optional[ApiConfig]]:
+        """Get several configuration items in one call
+
+        Bulk consumers (startup wiring that needs every provider config)
+        pay one method call instead of one per key, and any future read
+        lock needs a single acquisition here.
+        """
+        snapshot = self._snapshot
+        return {key: snapshot.get(key) for key in keys}
 
     def load_configs(self):
         """Load all configuration files"""
-        if not self.config_file.exists():
-            print(f"Failed to load config : {str(self.config_file)}")
-            pass
-        # Load JSON configuration
-        with open(self.config_file, 'r', encoding='utf-8') as f:
-            self.config.update(json.load(f))
+        if self.config_file.is_dir():
+            self._load_dir()
+            return
+        # Load JSON configuration, fingerprinted by mtime+size so warm
+        # restarts skip the parse entirely
+        stat = self.config_file.stat()
+        self._materialize(_parse_config(
+            str(self.config_file), stat.st_mtime_ns, stat.st_size))
+
+    def _load_dir(self):
+        """Load every config file in a directory with one scandir pass
+
+        os.scandir reports name and file type from the dirent itself, so
+        the whole directory costs a single readdir sweep — no per-entry
+        stat syscalls or Path allocations as two glob passes would pay.
+        """
+        with os.scandir(self.config_file) as entries:
+            paths = sorted(
+                entry.path for entry in entries
+                if entry.name.endswith(_CONFIG_SUFFIXES)
+                and entry.is_file(follow_symlinks=False))
+
+        if len(paths) <= 1:
+            for path in paths:
+                self._materialize(_parse_file(path))
+            return
+
+        # JSON/YAML parsing happens inside C extensions that release the
+        # GIL, so worker threads genuinely overlap the open+parse work;
+        # merging in sorted path order keeps overrides deterministic
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            for parsed in executor.map(_parse_file, paths):
+                self._materialize(parsed)
+
+    def _materialize(self, raw: Dict[str, Any]):
+        """Merge a loaded source layer and its typed ApiConfig records
+
+        Materializing once at load time makes the Dict[str, ApiConfig]
+        annotation honest and spares get_config consumers from
+        re-validating raw dicts on every access. The layer slots in
+        behind the save overlay so explicit saves keep winning.
+        """
+        with self._save_lock:
+            self._raw_config.maps.insert(1, raw)
+            overlay = dict(self._save_overlay)
+        self._update_snapshot(raw)
+        # Saved keys stay authoritative over freshly loaded sources in
+        # the typed view, matching the raw ChainMap's resolution order
+        if overlay:
+            self._update_snapshot(overlay)
+
+    def _update_snapshot(self, raw: Dict[str, Any]):
+        """Publish a new typed snapshot including the given raw entries"""
+        merged = dict(self._snapshot)
+        # Interned provider names hit the dict's pointer-equality fast
+        # path on every get_config and survive reloads as one object
+        merged.update({
+            sys.intern(key) if isinstance(key, str) else key:
+                ApiConfig.from_mapping(value) if isinstance(value, dict) else value
+            for key, value in raw.items()})
+        # Python attribute stores are atomic: concurrent readers see the
+        # old or the new complete snapshot, never an intermediate state
+        self._snapshot = MappingProxyType(merged)
 
     def save_config(self, key: str, value: Any) -> bool:
-        """Save configuration item"""
+        """Save configuration item (write-behind)
+
+        The in-memory config updates immediately; the disk write is
+        deferred so a burst of saves serializes and writes once when the
+        flush window closes instead of once per key. flush() forces the
+        write and shutdown() flushes pending changes.
+        """
+        try:
+            # Idempotent saves (health-check pokes, redundant UI writes)
+            # should not dirty the config or touch the disk at all
+            if self._raw_config.get(key) == value:
+                return True
+            with self._save_lock:
+                self._save_overlay[key] = value
+                self._dirty = True
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        self.FLUSH_INTERVAL, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            self._update_snapshot({key: value})
+            return True
+        except Exception:
+            return False
+
+    def flush(self) -> bool:
+        """Write pending configuration changes to disk
+
+        File-backed loaders rewrite their config file with the flattened
+        view. Directory-backed loaders persist just the saved keys to an
+        overrides.json inside the directory, which the next load picks
+        up like any other source file.
+        """
+        with self._save_lock:
+            timer, self._flush_timer = self._flush_timer, None
+            if timer is not None:
+                timer.cancel()
+            if not self._dirty:
+                return True
+            self._dirty = False
+            # Snapshot while holding the lock so the timer thread cannot
+            # observe a layer list mid-mutation
+            if self.config_file.is_dir():
+                target = self.config_file / "overrides.json"
+                payload = dict(self._save_overlay)
+            else:
+                target = self.config_file
+                payload = dict(self._raw_config)
         try:
-            self.config[key] = value
-            if not self.config_file.exists():
-                print(f"Failed to save config : {str(self.config_file)}")
-                pass
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
+            # Serialize first, then write to a sidecar and atomically
+            # replace: a crash mid-flush can no longer leave a truncated
+            # config behind, and the real file never holds partial bytes.
+            # The layered raw view is flattened only at write time.
+            buffer = _json.dumps_pretty(payload)
+            tmp_path = target.with_suffix(target.suffix + '.tmp')
+            tmp_path.write_bytes(buffer)
+            os.replace(tmp_path, target)
             return True
         except Exception:
+            # The batch is still pending: re-mark dirty so a later save,
+            # explicit flush or shutdown retries instead of silently
+            # dropping changes the caller was already told succeeded
+            with self._save_lock:
+                self._dirty = True
             return False
 
 